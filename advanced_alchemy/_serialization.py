@@ -57,6 +57,9 @@ try:
     def encode_json(data: Any) -> str:  # pragma: no cover
         return encoder.encode(data).decode("utf-8")
 
+    def encode_json_bytes(data: Any) -> bytes:  # pragma: no cover
+        return encoder.encode(data)
+
 except ImportError:
     try:
         from orjson import OPT_NAIVE_UTC, OPT_SERIALIZE_NUMPY, OPT_SERIALIZE_UUID
@@ -68,10 +71,18 @@ except ImportError:
                 data, default=_type_to_string, option=OPT_SERIALIZE_NUMPY | OPT_NAIVE_UTC | OPT_SERIALIZE_UUID
             ).decode("utf-8")  # type: ignore[no-any-return]
 
+        def encode_json_bytes(data: Any) -> bytes:  # pragma: no cover
+            return _encode_json(  # type: ignore[no-any-return]
+                data, default=_type_to_string, option=OPT_SERIALIZE_NUMPY | OPT_NAIVE_UTC | OPT_SERIALIZE_UUID
+            )
+
     except ImportError:
-        from json import dumps as encode_json  # type: ignore[assignment] # noqa: F401
+        from json import dumps as encode_json  # type: ignore[assignment]
         from json import loads as decode_json  # type: ignore[assignment]  # noqa: F401
 
+        def encode_json_bytes(data: Any) -> bytes:  # pragma: no cover
+            return encode_json(data).encode("utf-8")
+
 
 def convert_datetime_to_gmt_iso(dt: datetime.datetime) -> str:  # pragma: no cover
     """Handle datetime serialization for nested timestamps.
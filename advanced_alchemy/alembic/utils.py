@@ -1,22 +1,118 @@
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
+from weakref import WeakKeyDictionary
 
-from sqlalchemy import Engine, MetaData, Table
-from typing_extensions import TypeIs
+from sqlalchemy import Engine, MetaData, Table, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 
+from advanced_alchemy._serialization import encode_json_bytes
 from advanced_alchemy.exceptions import MissingDependencyError
 
 if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+    from collections.abc import AsyncIterator, Iterable, Iterator
+    from io import RawIOBase
+
+    from rich.console import Console
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm import DeclarativeBase, Session
 
-__all__ = ("drop_all", "dump_tables")
+__all__ = (
+    "drop_all",
+    "drop_all_async",
+    "drop_all_sync",
+    "dump_tables",
+    "dump_tables_async",
+    "dump_tables_sync",
+)
+
+T = TypeVar("T")
+
+_DUMP_BATCH_SIZE = 1000
+"""Number of rows fetched from the database per round-trip when dumping a table."""
+_DUMP_BUFFER_SIZE = 1 << 20
+"""Number of bytes buffered before dumped rows are written to disk."""
+_DUMP_COLUMN_KEYS: "WeakKeyDictionary[type[DeclarativeBase], tuple[str, ...]]" = WeakKeyDictionary()
+"""Dumped column attribute keys per model, held weakly so dumping a model doesn't keep it alive."""
+_DUMP_EXCLUDED_COLUMNS = frozenset(("sa_orm_sentinel", "_sentinel"))
+"""Internal columns that are never written to a dump."""
+_MAX_DUMP_WORKERS = 8
+"""Upper bound on the number of tables dumped concurrently."""
+
+_console: "Optional[Console]" = None
+"""The rich console, loaded on first use."""
+
+
+def _get_console() -> "Console":
+    """Return the rich console, importing it on first use.
+
+    Raises:
+        MissingDependencyError: If the `rich` package is not installed.
+
+    Returns:
+        The rich console.
+    """
+    global _console  # noqa: PLW0603
+    if _console is None:
+        try:
+            from rich import get_console
+        except ImportError as e:  # pragma: no cover
+            msg = "rich"
+            raise MissingDependencyError(msg, install_package="cli") from e
+        _console = get_console()
+    return _console
+
+
+def drop_all_sync(engine: Engine, version_table_name: str, metadata: MetaData) -> None:
+    """Drop all tables in the database using a synchronous engine.
+
+    Args:
+        engine: The database engine.
+        version_table_name: The name of the version table.
+        metadata: The metadata object containing the tables to drop.
+
+    Raises:
+        MissingDependencyError: If the `rich` package is not installed.
+    """
+    console = _get_console()
+    console.rule("[bold red]Connecting to database backend.")
+    with engine.begin() as db, _include_version_table(metadata, version_table_name):
+        console.rule("[bold red]Dropping the db and the version table", align="left")
+        metadata.drop_all(db, checkfirst=True)
+    console.rule("[bold yellow]Successfully dropped all objects", align="left")
+
+
+async def drop_all_async(engine: AsyncEngine, version_table_name: str, metadata: MetaData) -> None:
+    """Drop all tables in the database using an asynchronous engine.
+
+    Args:
+        engine: The database engine.
+        version_table_name: The name of the version table.
+        metadata: The metadata object containing the tables to drop.
+
+    Raises:
+        MissingDependencyError: If the `rich` package is not installed.
+    """
+    console = _get_console()
+    console.rule("[bold red]Connecting to database backend.", align="left")
+    async with engine.begin() as db:
+        with _include_version_table(metadata, version_table_name):
+            console.rule("[bold red]Dropping the db and the version table", align="left")
+            await db.run_sync(metadata.drop_all, checkfirst=True)
+    console.rule("[bold yellow]Successfully dropped all objects", align="left")
 
 
 async def drop_all(engine: "Union[AsyncEngine, Engine]", version_table_name: str, metadata: MetaData) -> None:
     """Drop all tables in the database.
 
+    Dispatches to :func:`drop_all_sync` or :func:`drop_all_async` depending on the engine type.  Callers that know
+    which kind of engine they hold can call those directly.
+
     Args:
         engine: The database engine.
         version_table_name: The name of the version table.
@@ -25,100 +121,298 @@ async def drop_all(engine: "Union[AsyncEngine, Engine]", version_table_name: str
     Raises:
         MissingDependencyError: If the `rich` package is not installed.
     """
-    try:
-        from rich import get_console
-    except ImportError as e:  # pragma: no cover
-        msg = "rich"
-        raise MissingDependencyError(msg, install_package="cli") from e
-
-    console = get_console()
-
-    def _is_sync(engine: "Union[Engine, AsyncEngine]") -> "TypeIs[Engine]":
-        return isinstance(engine, Engine)
-
-    def _drop_tables_sync(engine: Engine) -> None:
-        console.rule("[bold red]Connecting to database backend.")
-        with engine.begin() as db:
-            console.rule("[bold red]Dropping the db", align="left")
-            metadata.drop_all(db)
-            console.rule("[bold red]Dropping the version table", align="left")
-            Table(version_table_name, metadata).drop(db, checkfirst=True)
-        console.rule("[bold yellow]Successfully dropped all objects", align="left")
-
-    async def _drop_tables_async(engine: "AsyncEngine") -> None:
-        console.rule("[bold red]Connecting to database backend.", align="left")
-        async with engine.begin() as db:
-            console.rule("[bold red]Dropping the db", align="left")
-            await db.run_sync(metadata.drop_all)
-            console.rule("[bold red]Dropping the version table", align="left")
-            await db.run_sync(Table(version_table_name, metadata).drop, checkfirst=True)
-        console.rule("[bold yellow]Successfully dropped all objects", align="left")
-
-    if _is_sync(engine):
-        return _drop_tables_sync(engine)
-    return await _drop_tables_async(engine)
+    if isinstance(engine, Engine):
+        return drop_all_sync(engine, version_table_name, metadata)
+    return await drop_all_async(engine, version_table_name, metadata)
+
+
+def dump_tables_sync(
+    dump_dir: Path,
+    session: "AbstractContextManager[Session]",
+    models: "list[type[DeclarativeBase]]",
+    *,
+    concurrent: bool = False,
+) -> None:
+    """Dump the rows of each model's table to ``<dump_dir>/<table name>.json`` using a synchronous session.
+
+    Rows are selected as plain column values and fetched in batches, so memory use does not grow with the size of
+    the table.
+
+    With ``concurrent`` set, and when the session is bound to an engine whose pool can hand out several connections,
+    tables are dumped from worker threads.  Each worker reads on a new session of the same class bound to the same
+    engine, in its own transaction, so the dump is not a consistent snapshot and does not see uncommitted changes
+    made in ``session``.
+
+    Args:
+        dump_dir: The directory to write the JSON files to.
+        session: The session context manager to read the tables with.
+        models: The models whose tables should be dumped.
+        concurrent: Dump tables concurrently on separate sessions when the engine's pool allows it.
+
+    Raises:
+        MissingDependencyError: If the `rich` package is not installed.
+    """
+    console = _get_console()
+    dump_dir.mkdir(exist_ok=True)
+    with session as _session:
+        bind = _session.bind
+        concurrency = _get_dump_concurrency(bind, len(models)) if concurrent and isinstance(bind, Engine) else 1
+        if concurrency == 1:
+            for model in models:
+                _dump_model_sync(console, dump_dir, _session, model)
+            return
+        # sessions are not thread-safe, so every worker gets its own
+        session_factory = sessionmaker(bind=bind, class_=type(_session))
+
+        def _dump_model_in_new_session(model: "type[DeclarativeBase]") -> None:
+            with session_factory() as worker_session:
+                _dump_model_sync(console, dump_dir, worker_session, model)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            list(executor.map(_dump_model_in_new_session, models))
+        finally:
+            # don't start dumping the remaining tables once one has failed
+            executor.shutdown(cancel_futures=True)
+
+
+async def dump_tables_async(
+    dump_dir: Path,
+    session: "AbstractAsyncContextManager[AsyncSession]",
+    models: "list[type[DeclarativeBase]]",
+    *,
+    concurrent: bool = False,
+) -> None:
+    """Dump the rows of each model's table to ``<dump_dir>/<table name>.json`` using an asynchronous session.
+
+    Rows are selected as plain column values and fetched in batches with a server side cursor where the driver
+    supports it, so memory use does not grow with the size of the table.
+
+    With ``concurrent`` set, and when the session is bound to an engine whose pool can hand out several connections,
+    tables are dumped in concurrent tasks.  Each task reads on a new session of the same class bound to the same
+    engine, in its own transaction, so the dump is not a consistent snapshot and does not see uncommitted changes
+    made in ``session``.
+
+    Args:
+        dump_dir: The directory to write the JSON files to.
+        session: The session context manager to read the tables with.
+        models: The models whose tables should be dumped.
+        concurrent: Dump tables concurrently on separate sessions when the engine's pool allows it.
+
+    Raises:
+        MissingDependencyError: If the `rich` package is not installed.
+    """
+    console = _get_console()
+    dump_dir.mkdir(exist_ok=True)
+    async with session as _session:
+        bind = _session.bind
+        concurrency = (
+            _get_dump_concurrency(bind.sync_engine, len(models)) if concurrent and isinstance(bind, AsyncEngine) else 1
+        )
+        if concurrency == 1:
+            for model in models:
+                await _dump_model_async(console, dump_dir, _session, model)
+            return
+        # sessions are not concurrency-safe, so every task gets its own
+        session_factory = async_sessionmaker(bind=bind, class_=type(_session))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _dump_model_in_new_session(model: "type[DeclarativeBase]") -> None:
+            async with semaphore, session_factory() as worker_session:
+                await _dump_model_async(console, dump_dir, worker_session, model)
+
+        tasks = [asyncio.ensure_future(_dump_model_in_new_session(model)) for model in models]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # stop the remaining dumps once one has failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
 
 async def dump_tables(
     dump_dir: Path,
     session: "Union[AbstractContextManager[Session], AbstractAsyncContextManager[AsyncSession]]",
     models: "list[type[DeclarativeBase]]",
+    *,
+    concurrent: bool = False,
+) -> None:
+    """Dump the rows of each model's table to ``<dump_dir>/<table name>.json``.
+
+    Dispatches to :func:`dump_tables_sync` or :func:`dump_tables_async` depending on the session type.  Callers that
+    know which kind of session they hold can call those directly.
+
+    Args:
+        dump_dir: The directory to write the JSON files to.
+        session: The session context manager to read the tables with.
+        models: The models whose tables should be dumped.
+        concurrent: Dump tables concurrently on separate sessions when the engine's pool allows it.  See
+            :func:`dump_tables_sync` for the consistency trade-off.
+
+    Raises:
+        MissingDependencyError: If the `rich` package is not installed.
+    """
+    if isinstance(session, AbstractContextManager):
+        return dump_tables_sync(dump_dir, session, models, concurrent=concurrent)
+    return await dump_tables_async(dump_dir, session, models, concurrent=concurrent)
+
+
+def _dump_model_sync(console: "Console", dump_dir: Path, session: "Session", model: "type[DeclarativeBase]") -> None:
+    json_path = _get_dump_path(console, dump_dir, model)
+    result = session.execute(_get_dump_statement(model), execution_options={"yield_per": _DUMP_BATCH_SIZE})
+    with json_path.open("wb", buffering=0) as fp:
+        writer = _JSONArrayWriter(fp)
+        for partition in result.mappings().partitions():
+            writer.extend(encode_json_bytes([dict(row) for row in partition]))
+        writer.close()
+
+
+async def _dump_model_async(
+    console: "Console", dump_dir: Path, session: "AsyncSession", model: "type[DeclarativeBase]"
 ) -> None:
-    from types import new_class
+    json_path = _get_dump_path(console, dump_dir, model)
+    statement = _get_dump_statement(model)
+    execution_options = {"yield_per": _DUMP_BATCH_SIZE}
+    if session.get_bind(model).dialect.supports_server_side_cursors:
+        partitions = (await session.stream(statement, execution_options=execution_options)).mappings().partitions()
+    else:
+        # fall back to a buffered result for drivers without server side cursors
+        partitions = _as_async_iterator(
+            (await session.execute(statement, execution_options=execution_options)).mappings().partitions()
+        )
+    with json_path.open("wb", buffering=0) as fp:
+        writer = _JSONArrayWriter(fp)
+        async for partition in partitions:
+            writer.extend(encode_json_bytes([dict(row) for row in partition]))
+        writer.close()
+
+
+def _get_dump_path(console: "Console", dump_dir: Path, model: "type[DeclarativeBase]") -> Path:
+    json_path = dump_dir / f"{model.__tablename__}.json"
+    console.rule(
+        f"[yellow bold]Dumping table '{json_path.stem}' to '{json_path}'",
+        style="yellow",
+        align="left",
+    )
+    return json_path
+
 
-    from advanced_alchemy._serialization import encode_json
+class _JSONArrayWriter:
+    """Concatenate encoded JSON arrays into a single array written to ``fp``.
 
+    Output is accumulated in a buffer and flushed in chunks of ``_DUMP_BUFFER_SIZE`` bytes, so an unbuffered file
+    can be used without issuing a write per batch.
+    """
+
+    __slots__ = ("_buffer", "_empty", "_fp")
+
+    def __init__(self, fp: "RawIOBase") -> None:
+        self._fp = fp
+        self._buffer = bytearray(b"[")
+        self._empty = True
+
+    def extend(self, encoded_array: bytes) -> None:
+        """Append the items of an encoded JSON array.
+
+        Args:
+            encoded_array: A non-empty JSON array, as returned by ``encode_json_bytes``.
+        """
+        if not self._empty:
+            self._buffer += b","
+        # strip the enclosing brackets so that batches can be concatenated into a single array
+        with memoryview(encoded_array) as view:
+            self._buffer += view[1:-1]
+        self._empty = False
+        if len(self._buffer) >= _DUMP_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered output to the file.
+
+        Raises:
+            BlockingIOError: If the file is non-blocking and can't accept more output.
+        """
+        with memoryview(self._buffer) as view:
+            written = 0
+            while written < len(view):
+                count = self._fp.write(view[written:])
+                if count is None:
+                    # a non-blocking raw file that would block, retrying would spin forever
+                    msg = "The dump file can't accept more output without blocking"
+                    raise BlockingIOError(msg)
+                written += count
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Terminate the array and flush the remaining output."""
+        self._buffer += b"]"
+        self.flush()
+
+
+@contextmanager
+def _include_version_table(metadata: MetaData, version_table_name: str) -> "Iterator[None]":
+    """Temporarily register the version table on ``metadata`` so it is dropped in the same pass as the models.
+
+    Args:
+        metadata: The metadata object containing the tables to drop.
+        version_table_name: The name of the version table.
+
+    Yields:
+        None
+    """
+    registered = version_table_name in metadata.tables
+    version_table = Table(version_table_name, metadata, extend_existing=True)
     try:
-        from rich import get_console
-    except ImportError as e:  # pragma: no cover
-        msg = "rich"
-        raise MissingDependencyError(msg, install_package="cli") from e
+        yield
+    finally:
+        if not registered:
+            metadata.remove(version_table)
 
-    console = get_console()
 
-    def _is_sync(
-        session: "Union[AbstractAsyncContextManager[AsyncSession], AbstractContextManager[Session]]",
-    ) -> "TypeIs[AbstractContextManager[Session]]":
-        return isinstance(session, AbstractContextManager)
+def _get_dump_statement(model: "type[DeclarativeBase]") -> "Select[Any]":
+    """Build a statement selecting the dumped column values of ``model``.
 
-    def _dump_table_sync(session: "AbstractContextManager[Session]") -> None:
-        from advanced_alchemy.repository import SQLAlchemySyncRepository
+    Columns are selected individually, so rows are returned as plain tuples instead of ORM instances.
+    The result keys match :meth:`to_dict() <advanced_alchemy.base.BasicAttributes.to_dict>`.  Only the column keys
+    are cached per model, as a cached statement would reference the model and keep it alive.
 
-        with session as _session:
-            for model in models:
-                json_path = dump_dir / f"{model.__tablename__}.json"
-                console.rule(
-                    f"[yellow bold]Dumping table '{json_path.stem}' to '{json_path}'",
-                    style="yellow",
-                    align="left",
-                )
-                repo = new_class(
-                    "repo",
-                    (SQLAlchemySyncRepository,),
-                    exec_body=lambda ns, model=model: ns.setdefault("model_type", model),  # type: ignore[misc]
-                )
-                json_path.write_text(encode_json([row.to_dict() for row in repo(session=_session).list()]))
-
-    async def _dump_table_async(session: "AbstractAsyncContextManager[AsyncSession]") -> None:
-        from advanced_alchemy.repository import SQLAlchemyAsyncRepository
-
-        async with session as _session:
-            for model in models:
-                json_path = dump_dir / f"{model.__tablename__}.json"
-                console.rule(
-                    f"[yellow bold]Dumping table '{json_path.stem}' to '{json_path}'",
-                    style="yellow",
-                    align="left",
-                )
-                repo = new_class(
-                    "repo",
-                    (SQLAlchemyAsyncRepository,),
-                    exec_body=lambda ns, model=model: ns.setdefault("model_type", model),  # type: ignore[misc]
-                )
-                json_path.write_text(encode_json([row.to_dict() for row in await repo(session=_session).list()]))
+    Args:
+        model: The model to dump.
+
+    Returns:
+        A select statement for the dumped columns.
+    """
+    keys = _DUMP_COLUMN_KEYS.get(model)
+    if keys is None:
+        keys = _DUMP_COLUMN_KEYS[model] = tuple(
+            prop.key
+            for prop in model.__mapper__.column_attrs
+            if not prop.deferred and prop.key not in _DUMP_EXCLUDED_COLUMNS
+        )
+    return select(*(getattr(model, key) for key in keys))
+
+
+def _get_dump_concurrency(engine: Engine, table_count: int) -> int:
+    """Return how many tables can be dumped at once without exhausting the connection pool.
+
+    Args:
+        engine: The engine the tables are dumped from.
+        table_count: The number of tables to dump.
+
+    Returns:
+        The number of concurrent workers to use. ``1`` means the tables are dumped sequentially.
+    """
+    pool = engine.pool
+    if isinstance(pool, NullPool):
+        return min(table_count, _MAX_DUMP_WORKERS)
+    if isinstance(pool, QueuePool):
+        return min(table_count, pool.size() or _MAX_DUMP_WORKERS, _MAX_DUMP_WORKERS)
+    # single connection pools (e.g. in-memory SQLite) can't serve concurrent sessions
+    return 1
 
-    dump_dir.mkdir(exist_ok=True)
 
-    if _is_sync(session):
-        return _dump_table_sync(session)
-    return await _dump_table_async(session)
+async def _as_async_iterator(rows: "Iterable[T]") -> "AsyncIterator[T]":
+    for row in rows:
+        yield row
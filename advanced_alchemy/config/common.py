@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Optional, Union, cast
 
@@ -10,10 +11,12 @@ from advanced_alchemy.exceptions import ImproperConfigurationError
 from advanced_alchemy.utils.dataclass import Empty, simple_asdict
 
 if TYPE_CHECKING:
-    from sqlalchemy import Connection, Engine, MetaData
+    from sqlalchemy import URL, Connection, Engine, MetaData
+    from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
     from sqlalchemy.orm import Mapper, Query, Session, sessionmaker
     from sqlalchemy.orm.session import JoinTransactionMode
+    from sqlalchemy.pool import Pool
     from sqlalchemy.sql import TableClause
 
     from advanced_alchemy.utils.dataclass import EmptyType
@@ -32,6 +35,13 @@ __all__ = (
 
 ALEMBIC_TEMPLATE_PATH = f"{Path(__file__).parent.parent}/alembic/templates"
 """Path to the Alembic templates."""
+_DEPENDENT_CACHES: "dict[str, tuple[str, ...]]" = {
+    "connection_string": ("_identity_hash",),
+    "bind_key": ("_identity_hash",),
+    "engine_config": ("_identity_hash", "_engine_config_dict"),
+    "session_config": ("_session_config_dict",),
+}
+"""Cached values of :class:`GenericSQLAlchemyConfig` to discard when the given field is reassigned."""
 ConnectionT = TypeVar("ConnectionT", bound="Union[Connection, AsyncConnection]")
 """Type variable for SQLAlchemy connection types.
 
@@ -62,6 +72,68 @@ SessionMakerT = TypeVar("SessionMakerT", bound="Union[sessionmaker[Session], asy
 """
 
 
+def _load_dialect(connection_string: str) -> "Optional[tuple[URL, type[DefaultDialect]]]":
+    """Resolve the dialect class for ``connection_string`` without connecting or importing the DBAPI.
+
+    Args:
+        connection_string: The database connection string.
+
+    Returns:
+        The parsed URL and its dialect class, or ``None`` if the dialect can't be loaded.
+    """
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.exc import ArgumentError
+
+    try:
+        url = make_url(connection_string)
+        return url, cast("type[DefaultDialect]", url.get_dialect())
+    except ArgumentError:
+        return None
+
+
+_JSON_SERIALIZER_DIALECTS: "dict[type[DefaultDialect], bool]" = {}
+"""Cached results of :func:`_dialect_accepts_json_serializer`."""
+
+
+def _dialect_accepts_json_serializer(dialect_cls: "type[DefaultDialect]") -> bool:
+    """Determine if ``create_engine`` accepts the JSON (de)serializer arguments for a dialect.
+
+    Args:
+        dialect_cls: The dialect class.
+
+    Returns:
+        ``True`` if the dialect takes ``json_serializer`` and ``json_deserializer`` arguments.
+    """
+    accepts = _JSON_SERIALIZER_DIALECTS.get(dialect_cls)
+    if accepts is None:
+        from sqlalchemy.util import get_cls_kwargs
+
+        accepts = _JSON_SERIALIZER_DIALECTS[dialect_cls] = "json_serializer" in get_cls_kwargs(dialect_cls)
+    return accepts
+
+
+def _uses_queue_pool(dialect: "Optional[tuple[URL, type[DefaultDialect]]]", poolclass: "Optional[type[Pool]]") -> bool:
+    """Determine if an engine will use a :class:`QueuePool <sqlalchemy.pool.QueuePool>`.
+
+    Only queue pools accept the ``pool_use_lifo`` engine argument.
+
+    Args:
+        dialect: The URL and dialect class returned by :func:`_load_dialect`.
+        poolclass: The configured pool class, if any.
+
+    Returns:
+        ``True`` if the engine will use a queue pool.
+    """
+    from sqlalchemy.pool import QueuePool
+
+    if poolclass is None:
+        if dialect is None:
+            return False
+        url, dialect_cls = dialect
+        poolclass = dialect_cls.get_pool_class(url)
+    return issubclass(poolclass, QueuePool)
+
+
 @dataclass
 class GenericSessionConfig(Generic[ConnectionT, EngineT, SessionT]):
     """SQLAlchemy async session config.
@@ -112,6 +184,23 @@ class GenericSessionConfig(Generic[ConnectionT, EngineT, SessionT]):
     :class:`TwoPhaseTransaction <sqlalchemy.engine.TwoPhaseTransaction>` will be called. This allows each database to
     roll back the entire transaction, before each transaction is committed."""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__dataclass_fields__:
+            # per-instance tracker of the fields holding a value other than ``Empty``. It lives only in the instance
+            # ``__dict__`` so that it isn't a dataclass field, and is replaced rather than mutated so that shallow
+            # copies never share it.
+            set_fields = tuple(field_name for field_name in self.__dict__.get("_set_fields", ()) if field_name != name)
+            self.__dict__["_set_fields"] = set_fields if value is Empty else (*set_fields, name)
+
+    def _to_dict(self) -> dict[str, Any]:
+        """Return the fields that have been set as a dict.
+
+        Returns:
+            A string keyed dict of the non-:class:`Empty <advanced_alchemy.utils.dataclass.Empty>` fields.
+        """
+        return {field_name: getattr(self, field_name) for field_name in self.__dict__.get("_set_fields", ())}
+
 
 @dataclass
 class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
@@ -181,12 +270,14 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
     This is a listener that will automatically save and delete :class:`FileObject <advanced_alchemy.types.file_object.FileObject>` instances when they are saved or deleted.
 
     Disable if you plan to bring your own save/delete mechanism for these columns"""
-    _SESSION_SCOPE_KEY_REGISTRY: "ClassVar[set[str]]" = field(init=False, default=cast("set[str]", set()))
-    """Internal counter for ensuring unique identification of session scope keys in the class."""
-    _ENGINE_APP_STATE_KEY_REGISTRY: "ClassVar[set[str]]" = field(init=False, default=cast("set[str]", set()))
-    """Internal counter for ensuring unique identification of engine app state keys in the class."""
-    _SESSIONMAKER_APP_STATE_KEY_REGISTRY: "ClassVar[set[str]]" = field(init=False, default=cast("set[str]", set()))
-    """Internal counter for ensuring unique identification of sessionmaker state keys in the class."""
+    _SESSION_SCOPE_KEY_REGISTRY: ClassVar[set[str]] = set()
+    """Session scope keys in use by live configs.
+
+    Shared by all config classes, as the keys of every config are stored in the same application state."""
+    _ENGINE_APP_STATE_KEY_REGISTRY: ClassVar[set[str]] = set()
+    """Engine app state keys in use by live configs."""
+    _SESSIONMAKER_APP_STATE_KEY_REGISTRY: ClassVar[set[str]] = set()
+    """Sessionmaker app state keys in use by live configs."""
 
     def __post_init__(self) -> None:
         if self.connection_string is not None and self.engine_instance is not None:
@@ -202,24 +293,54 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
 
             from advanced_alchemy._listeners import touch_updated_timestamp
 
-            event.listen(Session, "before_flush", touch_updated_timestamp)
+            if not event.contains(Session, "before_flush", touch_updated_timestamp):
+                event.listen(Session, "before_flush", touch_updated_timestamp)
         if self.enable_file_object_listener:
             from advanced_alchemy._listeners import setup_file_object_listeners
 
             setup_file_object_listeners()
 
-    def __hash__(self) -> int:  # pragma: no cover
-        return hash(
-            (
-                self.__class__.__qualname__,
-                self.connection_string,
-                self.engine_config.__class__.__qualname__,
-                self.bind_key,
-            )
+    def __setattr__(self, name: str, value: Any) -> None:
+        for cached in _DEPENDENT_CACHES.get(name, ()):
+            self.__dict__.pop(cached, None)
+        super().__setattr__(name, value)
+
+    def _reset_cache(self) -> None:
+        """Discard cached values derived from the configuration.
+
+        Call this after mutating ``engine_config`` or ``session_config`` in place.
+        """
+        for cached in ("_identity_hash", "_engine_config_dict", "_session_config_dict"):
+            self.__dict__.pop(cached, None)
+
+    def _identity(self) -> "tuple[str, Optional[str], str, Optional[str]]":
+        return (
+            self.__class__.__qualname__,
+            self.connection_string,
+            self.engine_config.__class__.__qualname__,
+            self.bind_key,
         )
 
+    def __hash__(self) -> int:
+        # cached until one of the identity fields is reassigned
+        try:
+            return cast("int", self.__dict__["_identity_hash"])
+        except KeyError:
+            identity_hash = self.__dict__["_identity_hash"] = hash(self._identity())
+            return identity_hash
+
     def __eq__(self, other: object) -> bool:
-        return self.__hash__() == other.__hash__()
+        if not isinstance(other, GenericSQLAlchemyConfig):
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    @cached_property
+    def _engine_config_dict(self) -> dict[str, Any]:
+        return simple_asdict(self.engine_config, exclude_empty=True)
+
+    @cached_property
+    def _session_config_dict(self) -> dict[str, Any]:
+        return self.session_config._to_dict()  # noqa: SLF001
 
     @property
     def engine_config_dict(self) -> dict[str, Any]:
@@ -229,7 +350,7 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             A string keyed dict of config kwargs for the SQLAlchemy :func:`sqlalchemy.get_engine`
             function.
         """
-        return simple_asdict(self.engine_config, exclude_empty=True)
+        return dict(self._engine_config_dict)
 
     @property
     def session_config_dict(self) -> dict[str, Any]:
@@ -239,7 +360,7 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             A string keyed dict of config kwargs for the SQLAlchemy :class:`sqlalchemy.orm.sessionmaker`
             class.
         """
-        return simple_asdict(self.session_config, exclude_empty=True)
+        return dict(self._session_config_dict)
 
     def get_engine(self) -> EngineT:
         """Return an engine. If none exists yet, create one.
@@ -258,12 +379,23 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             raise ImproperConfigurationError(msg)
 
         engine_config = self.engine_config_dict
+        dialect = _load_dialect(self.connection_string)
+        engine_config.setdefault("query_cache_size", 2048)
+        # pool arguments can't be combined with an explicit pool instance
+        if "pool" not in engine_config:
+            engine_config.setdefault("pool_pre_ping", True)
+            if _uses_queue_pool(dialect, engine_config.get("poolclass")):
+                engine_config.setdefault("pool_use_lifo", True)
+        if dialect is not None and not _dialect_accepts_json_serializer(dialect[1]):
+            # the dialect doesn't support the json type
+            engine_config.pop("json_deserializer", None)
+            engine_config.pop("json_serializer", None)
         try:
             self.engine_instance = self.create_engine_callable(self.connection_string, **engine_config)
         except TypeError:
-            # likely due to a dialect that doesn't support json type
-            del engine_config["json_deserializer"]
-            del engine_config["json_serializer"]
+            # fallback for dialects that can't be resolved up front
+            engine_config.pop("json_deserializer", None)
+            engine_config.pop("json_serializer", None)
             self.engine_instance = self.create_engine_callable(self.connection_string, **engine_config)
         return self.engine_instance
 
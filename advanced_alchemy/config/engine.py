@@ -115,7 +115,9 @@ class EngineConfig:
     “sqlalchemy.pool” logger. Defaults to a hexstring of the object`s id."""
     pool_pre_ping: "Union[bool, EmptyType]" = Empty
     """If True will enable the connection pool “pre-ping” feature that tests connections for liveness upon each
-    checkout."""
+    checkout.
+
+    Enabled by default when the engine is created from a connection string."""
     pool_size: "Union[int, EmptyType]" = Empty
     """The number of connections to keep open inside the connection pool. This used with
     :class:`QueuePool <sqlalchemy.pool.QueuePool>` as well as
@@ -139,13 +141,19 @@ class EngineConfig:
     """Use LIFO (last-in-first-out) when retrieving connections from :class:`QueuePool <sqlalchemy.pool.QueuePool>`
     instead of FIFO (first-in-first-out). Using LIFO, a server-side timeout scheme can reduce the number of connections
     used during non-peak periods of use. When planning for server-side timeouts, ensure that a recycle or pre-ping
-    strategy is in use to gracefully handle stale connections."""
+    strategy is in use to gracefully handle stale connections.
+
+    Enabled by default when the engine is created from a connection string and uses a
+    :class:`QueuePool <sqlalchemy.pool.QueuePool>`."""
     plugins: "Union[list[str], EmptyType]" = Empty
     """String list of plugin names to load. See :class:`CreateEnginePlugin <sqlalchemy.engine.CreateEnginePlugin>` for
     background."""
     query_cache_size: "Union[int, EmptyType]" = Empty
     """Size of the cache used to cache the SQL string form of queries. Set to zero to disable caching.
 
+    Defaults to ``2048`` rather than SQLAlchemy's ``500``, so that applications with many models don't evict their
+    compiled statements.
+
     See :attr:`query_cache_size <sqlalchemy.get_engine.params.query_cache_size>` for more info.
     """
     use_insertmanyvalues: "Union[bool, EmptyType]" = Empty
@@ -1,12 +1,21 @@
 import re
-from collections.abc import Generator
-from contextlib import contextmanager
-from typing import Any, Callable, Optional, TypedDict, Union, cast
+from contextlib import ContextDecorator
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypedDict, Union, cast
 
 from sqlalchemy.exc import IntegrityError as SQLAlchemyIntegrityError
 from sqlalchemy.exc import InvalidRequestError as SQLAlchemyInvalidRequestError
 from sqlalchemy.exc import MultipleResultsFound, SQLAlchemyError, StatementError
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
+try:
+    import re2  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    re2 = None
+
 __all__ = (
     "AdvancedAlchemyError",
     "DuplicateKeyError",
@@ -26,18 +35,18 @@ __all__ = (
 DUPLICATE_KEY_REGEXES = {
     "postgresql": [
         re.compile(
-            r"^.*duplicate\s+key.*\"(?P<columns>[^\"]+)\"\s*\n.*Key\s+\((?P<key>.*)\)=\((?P<value>.*)\)\s+already\s+exists.*$",
+            r"duplicate\s+key[^\n]*\"(?P<columns>[^\"]+)\"\s*\n[^\n]*Key\s+\((?P<key>[^\n]*)\)=\((?P<value>[^\n]*)\)\s+already\s+exists",
         ),
-        re.compile(r"^.*duplicate\s+key.*\"(?P<columns>[^\"]+)\"\s*\n.*$"),
+        re.compile(r"duplicate\s+key[^\n]*\"(?P<columns>[^\"]+)\"\s*\n"),
     ],
     "sqlite": [
-        re.compile(r"^.*columns?(?P<columns>[^)]+)(is|are)\s+not\s+unique$"),
-        re.compile(r"^.*UNIQUE\s+constraint\s+failed:\s+(?P<columns>.+)$"),
-        re.compile(r"^.*PRIMARY\s+KEY\s+must\s+be\s+unique.*$"),
+        re.compile(r"columns?(?P<columns>[^)]+)(is|are)\s+not\s+unique"),
+        re.compile(r"UNIQUE\s+constraint\s+failed:\s+(?P<columns>[^\n]+)"),
+        re.compile(r"PRIMARY\s+KEY\s+must\s+be\s+unique"),
     ],
     "mysql": [
-        re.compile(r"^.*\b1062\b.*Duplicate entry '(?P<value>.*)' for key '(?P<columns>[^']+)'.*$"),
-        re.compile(r"^.*\b1062\b.*Duplicate entry \\'(?P<value>.*)\\' for key \\'(?P<columns>.+)\\'.*$"),
+        re.compile(r"\b1062\b[^\n]*Duplicate entry '(?P<value>[^\n]*)' for key '(?P<columns>[^']+)'"),
+        re.compile(r"\b1062\b[^\n]*Duplicate entry \\'(?P<value>[^\n]*)\\' for key \\'(?P<columns>[^\n]+)\\'"),
     ],
     "oracle": [],
     "spanner+spanner": [],
@@ -50,22 +59,22 @@ DUPLICATE_KEY_REGEXES = {
 FOREIGN_KEY_REGEXES = {
     "postgresql": [
         re.compile(
-            r".*on table \"(?P<table>[^\"]+)\" violates "
-            r"foreign key constraint \"(?P<constraint>[^\"]+)\".*\n"
-            r"DETAIL:  Key \((?P<key>.+)\)=\(.+\) "
+            r"on table \"(?P<table>[^\"]+)\" violates "
+            r"foreign key constraint \"(?P<constraint>[^\"]+)\"[^\n]*\n"
+            r"DETAIL:  Key \((?P<key>[^\n]+)\)=\([^\n]+\) "
             r"is (not present in|still referenced from) table "
             r"\"(?P<key_table>[^\"]+)\".",
         ),
     ],
     "sqlite": [
-        re.compile(r"(?i).*foreign key constraint failed"),
+        re.compile(r"foreign key constraint failed"),
     ],
     "mysql": [
         re.compile(
-            r".*Cannot (add|delete) or update a (child|parent) row: "
-            r'a foreign key constraint fails \([`"].+[`"]\.[`"](?P<table>.+)[`"], '
-            r'CONSTRAINT [`"](?P<constraint>.+)[`"] FOREIGN KEY '
-            r'\([`"](?P<key>.+)[`"]\) REFERENCES [`"](?P<key_table>.+)[`"] ',
+            r"Cannot (add|delete) or update a (child|parent) row: "
+            r'a foreign key constraint fails \([`"][^\n]+[`"]\.[`"](?P<table>[^\n]+)[`"], '
+            r'CONSTRAINT [`"](?P<constraint>[^\n]+)[`"] FOREIGN KEY '
+            r'\([`"](?P<key>[^\n]+)[`"]\) REFERENCES [`"](?P<key_table>[^\n]+)[`"] ',
         ),
     ],
     "oracle": [],
@@ -78,7 +87,7 @@ FOREIGN_KEY_REGEXES = {
 
 CHECK_CONSTRAINT_REGEXES = {
     "postgresql": [
-        re.compile(r".*new row for relation \"(?P<table>.+)\" violates check constraint (?P<check_name>.+)"),
+        re.compile(r"new row for relation \"(?P<table>[^\n]+)\" violates check constraint (?P<check_name>[^\n]+)"),
     ],
     "sqlite": [],
     "mysql": [],
@@ -91,6 +100,86 @@ CHECK_CONSTRAINT_REGEXES = {
 }
 
 
+_GROUP_NAME_PATTERN = re.compile(r"\(\?P<(\w+)>")
+
+
+def _union_patterns(patterns: "list[re.Pattern[str]]") -> "re.Pattern[str]":
+    """Combine ``patterns`` into a single alternation, so that one scan checks all of them.
+
+    Group names must be unique within a pattern, so each one is suffixed with the index of the pattern it came from.
+
+    Args:
+        patterns: The patterns to combine.
+
+    Returns:
+        The combined pattern.
+    """
+    alternatives: list[str] = []
+    for index, pattern in enumerate(patterns):
+        source = _GROUP_NAME_PATTERN.sub(rf"(?P<\g<1>{index}>", pattern.pattern)
+        alternatives.append(f"(?:{source})")
+    return _compile_pattern("|".join(alternatives))
+
+
+def _compile_pattern(source: str) -> "re.Pattern[str]":
+    """Compile a pattern matched against driver errors.
+
+    When ``google-re2`` is installed, the pattern is compiled with RE2, which matches in linear time regardless of the
+    input.  Patterns RE2 does not support are compiled with :mod:`re`.
+
+    Args:
+        source: The pattern to compile.
+
+    Returns:
+        The compiled pattern.
+    """
+    if re2 is not None:
+        try:
+            return cast("re.Pattern[str]", re2.compile(source))
+        except re2.error:
+            pass
+    return re.compile(source)
+
+
+_DUPLICATE_KEY_PATTERNS = {
+    dialect: _union_patterns(patterns) for dialect, patterns in DUPLICATE_KEY_REGEXES.items() if patterns
+}
+"""Each dialect's :data:`DUPLICATE_KEY_REGEXES` combined into a single pattern."""
+_FOREIGN_KEY_PATTERNS = {
+    dialect: _union_patterns(patterns) for dialect, patterns in FOREIGN_KEY_REGEXES.items() if patterns
+}
+"""Each dialect's :data:`FOREIGN_KEY_REGEXES` combined into a single pattern."""
+_CHECK_CONSTRAINT_PATTERNS = {
+    dialect: _union_patterns(patterns) for dialect, patterns in CHECK_CONSTRAINT_REGEXES.items() if patterns
+}
+"""Each dialect's :data:`CHECK_CONSTRAINT_REGEXES` combined into a single pattern."""
+
+_DIALECT_KEYWORDS: "dict[str, dict[str, tuple[str, ...]]]" = {
+    "postgresql": {
+        "duplicate_key": ("duplicate",),
+        "foreign_key": ("foreign key constraint",),
+        "check_constraint": ("check constraint",),
+    },
+    "sqlite": {
+        "duplicate_key": ("unique",),
+        "foreign_key": ("foreign key constraint failed",),
+    },
+    "mysql": {
+        "duplicate_key": ("1062",),
+        "foreign_key": ("foreign key constraint fails",),
+    },
+}
+"""Lowercase keywords that the driver error must contain for any of the dialect's patterns to match.
+
+Checked before running the patterns of a group, as a substring test is much cheaper than a regex scan.
+"""
+_CASE_INSENSITIVE = frozenset({("sqlite", "foreign_key")})
+"""``(dialect, error message key)`` groups whose lowercase patterns are matched against the lowercased driver error.
+
+Used instead of ``(?i)``, as the driver error is lowercased for the keyword check anyway.
+"""
+
+
 class AdvancedAlchemyError(Exception):
     """Base exception class from which all Advanced Alchemy exceptions inherit."""
 
@@ -118,7 +207,11 @@ class AdvancedAlchemyError(Exception):
         return self.__class__.__name__
 
     def __str__(self) -> str:
-        return " ".join((*self.args, self.detail)).strip()
+        if not self.args:
+            return self.detail.strip()
+        if not self.detail:
+            return " ".join(self.args).strip()
+        return f"{' '.join(self.args)} {self.detail}".strip()
 
 
 class MissingDependencyError(AdvancedAlchemyError, ImportError):
@@ -240,19 +333,169 @@ class ErrorMessages(TypedDict, total=False):
     not_found: Union[str, Callable[[Exception], str]]
 
 
-def _get_error_message(error_messages: ErrorMessages, key: str, exc: Exception) -> str:
-    template: Union[str, Callable[[Exception], str]] = error_messages.get(key, f"{key} error: {exc}")  # type: ignore[assignment]
+_DEFAULT_ERROR_MESSAGES: "Mapping[str, Union[str, Callable[[Exception], str]]]" = MappingProxyType(
+    {
+        "not_found": "No rows matched the specified data",
+        "multiple_rows": "Multiple rows matched the specified data",
+        "integrity": lambda exc: f"An integrity error occurred: {exc}",
+        "other": lambda exc: f"An exception occurred: {exc}",
+    }
+)
+"""Messages used when :func:`wrap_sqlalchemy_exception` is not given any ``error_messages``."""
+
+
+_INTEGRITY_DISPATCH: "dict[str, tuple[tuple[str, re.Pattern[str], type[IntegrityError], Optional[tuple[str, ...]], bool], ...]]" = {
+    dialect: tuple(
+        (
+            key,
+            patterns[dialect],
+            exception,
+            _DIALECT_KEYWORDS.get(dialect, {}).get(key),
+            (dialect, key) in _CASE_INSENSITIVE,
+        )
+        for key, patterns, exception in (
+            ("duplicate_key", _DUPLICATE_KEY_PATTERNS, DuplicateKeyError),
+            ("check_constraint", _CHECK_CONSTRAINT_PATTERNS, IntegrityError),
+            ("foreign_key", _FOREIGN_KEY_PATTERNS, ForeignKeyError),
+        )
+        if dialect in patterns
+    )
+    for dialect in DUPLICATE_KEY_REGEXES.keys() | FOREIGN_KEY_REGEXES.keys() | CHECK_CONSTRAINT_REGEXES.keys()
+}
+"""The ``(error message key, pattern, exception, keywords, case insensitive)`` entries checked for an integrity error
+of each dialect."""
+
+
+def _contains_any(text: str, keywords: "tuple[str, ...]") -> bool:
+    # a plain loop rather than ``any()`` over a generator, which allocates a generator and frame per call
+    for keyword in keywords:  # noqa: SIM110
+        if keyword in text:
+            return True
+    return False
+
+
+def _get_error_message(
+    error_messages: "Union[ErrorMessages, Mapping[str, Union[str, Callable[[Exception], str]]]]",
+    key: str,
+    exc: Exception,
+) -> str:
+    template: Optional[Union[str, Callable[[Exception], str]]] = error_messages.get(key)  # type: ignore[assignment]
+    if template is None:
+        return f"{key} error: {exc}"
     if callable(template):  # pyright: ignore[reportUnknownArgumentType]
         template = template(exc)  # pyright: ignore[reportUnknownVariableType]
     return template  # pyright: ignore[reportUnknownVariableType]
 
 
-@contextmanager
-def wrap_sqlalchemy_exception(  # noqa: C901, PLR0915
+class _WrapSQLAlchemyException(ContextDecorator):
+    """Context manager returned by :func:`wrap_sqlalchemy_exception`.
+
+    Implemented as a class rather than with :func:`contextlib.contextmanager`, as it wraps every repository operation
+    and a generator based context manager allocates a generator and frame on each use.
+    """
+
+    def __init__(
+        self,
+        error_messages: Optional[ErrorMessages],
+        dialect_name: Optional[str],
+        wrap_exceptions: bool,
+    ) -> None:
+        self.error_messages = error_messages
+        self.messages = error_messages if error_messages is not None else _DEFAULT_ERROR_MESSAGES
+        self.dialect_name = dialect_name
+        self.wrap_exceptions = wrap_exceptions
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[BaseException]]",  # noqa: PYI036
+        exc_val: "Optional[BaseException]",  # noqa: PYI036
+        exc_tb: "Optional[TracebackType]",  # noqa: PYI036
+    ) -> None:
+        if exc_val is None or self.wrap_exceptions is False:
+            return
+        # the most specific handled class wins, as the ``isinstance`` checks this replaces were ordered that way
+        for base in type(exc_val).__mro__:
+            handler = _EXCEPTION_HANDLERS.get(base)
+            if handler is not None:
+                raise handler(self, cast("Exception", exc_val)) from exc_val
+
+
+def _handle_not_found(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:
+    return NotFoundError(detail=_get_error_message(error_messages=context.messages, key="not_found", exc=exc))
+
+
+def _handle_multiple_results_found(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:
+    return MultipleResultsFoundError(
+        detail=_get_error_message(error_messages=context.messages, key="multiple_rows", exc=exc)
+    )
+
+
+def _handle_integrity_error(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:
+    error_messages, dialect_name = context.error_messages, context.dialect_name
+    if error_messages is None or dialect_name is None:
+        return IntegrityError(
+            detail=_get_error_message(error_messages=_DEFAULT_ERROR_MESSAGES, key="integrity", exc=exc)
+        )
+    # dialects without patterns can skip formatting the driver error
+    if dispatch := _INTEGRITY_DISPATCH.get(dialect_name):
+        orig_args = cast("SQLAlchemyIntegrityError", exc).orig.args  # type: ignore[union-attr] # pyright: ignore[reportOptionalMemberAccess]
+        # drivers usually raise with a single message argument
+        if len(orig_args) == 1 and isinstance(orig_args[0], str):
+            detail = orig_args[0]
+        else:
+            detail = " - ".join(map(str, orig_args))
+        detail_lower = detail.lower()
+        for key, regex, exception, keywords, case_insensitive in dispatch:
+            if keywords is not None and not _contains_any(detail_lower, keywords):
+                continue
+            if regex.search(detail_lower if case_insensitive else detail) is not None:
+                return exception(detail=_get_error_message(error_messages=error_messages, key=key, exc=exc))
+    return IntegrityError(detail=_get_error_message(error_messages=error_messages, key="integrity", exc=exc))
+
+
+def _handle_invalid_request(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:  # noqa: ARG001
+    return InvalidRequestError(detail="An invalid request was made.")
+
+
+def _handle_statement_error(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:  # noqa: ARG001
+    return IntegrityError(
+        detail=cast(
+            "str",
+            getattr(cast("StatementError", exc).orig, "detail", "There was an issue processing the statement."),
+        )
+    )
+
+
+def _handle_sqlalchemy_error(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:
+    return RepositoryError(detail=_get_error_message(error_messages=context.messages, key="other", exc=exc))
+
+
+def _handle_attribute_error(context: _WrapSQLAlchemyException, exc: Exception) -> AdvancedAlchemyError:
+    if context.error_messages is not None:
+        return RepositoryError(detail=_get_error_message(error_messages=context.error_messages, key="other", exc=exc))
+    return RepositoryError(detail=f"An attribute error occurred during processing: {exc}")
+
+
+_EXCEPTION_HANDLERS: "dict[type[Exception], Callable[[_WrapSQLAlchemyException, Exception], AdvancedAlchemyError]]" = {
+    NotFoundError: _handle_not_found,
+    MultipleResultsFound: _handle_multiple_results_found,
+    SQLAlchemyIntegrityError: _handle_integrity_error,
+    SQLAlchemyInvalidRequestError: _handle_invalid_request,
+    StatementError: _handle_statement_error,
+    SQLAlchemyError: _handle_sqlalchemy_error,
+    AttributeError: _handle_attribute_error,
+}
+"""Build the repository error raised for each wrapped exception class."""
+
+
+def wrap_sqlalchemy_exception(
     error_messages: Optional[ErrorMessages] = None,
     dialect_name: Optional[str] = None,
     wrap_exceptions: bool = True,
-) -> Generator[None, None, None]:
+) -> _WrapSQLAlchemyException:
     """Do something within context to raise a ``RepositoryError`` chained
     from an original ``SQLAlchemyError``.
 
@@ -270,6 +513,9 @@ def wrap_sqlalchemy_exception(  # noqa: C901, PLR0915
         dialect_name: The name of the dialect to use for the exception.
         wrap_exceptions: Wrap SQLAlchemy exceptions in a ``RepositoryError``.  When set to ``False``, the original exception will be raised.
 
+    Returns:
+        A context manager that translates the exceptions raised within it.  It can also be used as a decorator.
+
     Raises:
         NotFoundError: Raised when no rows matched the specified data.
         MultipleResultsFound: Raised when multiple rows matched the specified data.
@@ -282,69 +528,4 @@ def wrap_sqlalchemy_exception(  # noqa: C901, PLR0915
         MultipleResultsFoundError: Raised when multiple rows matched the specified data.
 
     """
-    try:
-        yield
-
-    except NotFoundError as exc:
-        if wrap_exceptions is False:
-            raise
-        if error_messages is not None:
-            msg = _get_error_message(error_messages=error_messages, key="not_found", exc=exc)
-        else:
-            msg = "No rows matched the specified data"
-        raise NotFoundError(detail=msg) from exc
-    except MultipleResultsFound as exc:
-        if wrap_exceptions is False:
-            raise
-        if error_messages is not None:
-            msg = _get_error_message(error_messages=error_messages, key="multiple_rows", exc=exc)
-        else:
-            msg = "Multiple rows matched the specified data"
-        raise MultipleResultsFoundError(detail=msg) from exc
-    except SQLAlchemyIntegrityError as exc:
-        if wrap_exceptions is False:
-            raise
-        if error_messages is not None and dialect_name is not None:
-            keys_to_regex = {
-                "duplicate_key": (DUPLICATE_KEY_REGEXES.get(dialect_name, []), DuplicateKeyError),
-                "check_constraint": (CHECK_CONSTRAINT_REGEXES.get(dialect_name, []), IntegrityError),
-                "foreign_key": (FOREIGN_KEY_REGEXES.get(dialect_name, []), ForeignKeyError),
-            }
-            detail = " - ".join(str(exc_arg) for exc_arg in exc.orig.args) if exc.orig.args else ""  # type: ignore[union-attr] # pyright: ignore[reportArgumentType,reportOptionalMemberAccess]
-            for key, (regexes, exception) in keys_to_regex.items():
-                for regex in regexes:
-                    if (match := regex.findall(detail)) and match[0]:
-                        raise exception(
-                            detail=_get_error_message(error_messages=error_messages, key=key, exc=exc),
-                        ) from exc
-
-            raise IntegrityError(
-                detail=_get_error_message(error_messages=error_messages, key="integrity", exc=exc),
-            ) from exc
-        raise IntegrityError(detail=f"An integrity error occurred: {exc}") from exc
-    except SQLAlchemyInvalidRequestError as exc:
-        if wrap_exceptions is False:
-            raise
-        raise InvalidRequestError(detail="An invalid request was made.") from exc
-    except StatementError as exc:
-        if wrap_exceptions is False:
-            raise
-        raise IntegrityError(
-            detail=cast("str", getattr(exc.orig, "detail", "There was an issue processing the statement."))
-        ) from exc
-    except SQLAlchemyError as exc:
-        if wrap_exceptions is False:
-            raise
-        if error_messages is not None:
-            msg = _get_error_message(error_messages=error_messages, key="other", exc=exc)
-        else:
-            msg = f"An exception occurred: {exc}"
-        raise RepositoryError(detail=msg) from exc
-    except AttributeError as exc:
-        if wrap_exceptions is False:
-            raise
-        if error_messages is not None:
-            msg = _get_error_message(error_messages=error_messages, key="other", exc=exc)
-        else:
-            msg = f"An attribute error occurred during processing: {exc}"
-        raise RepositoryError(detail=msg) from exc
+    return _WrapSQLAlchemyException(error_messages, dialect_name, wrap_exceptions)
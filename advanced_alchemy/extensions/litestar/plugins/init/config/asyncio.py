@@ -2,6 +2,7 @@ from collections.abc import AsyncGenerator, Coroutine
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, cast
+from weakref import finalize
 
 from litestar.cli._utils import console  # pyright: ignore
 from litestar.constants import HTTP_RESPONSE_START
@@ -175,9 +176,14 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
             "_SESSIONMAKER_APP_STATE_KEY_REGISTRY",
             self.session_maker_app_state_key,
         )
-        self.__class__._SESSION_SCOPE_KEY_REGISTRY.add(self.session_scope_key)  # noqa: SLF001
-        self.__class__._ENGINE_APP_STATE_KEY_REGISTRY.add(self.engine_app_state_key)  # noqa: SLF001
-        self.__class__._SESSIONMAKER_APP_STATE_KEY_REGISTRY.add(self.session_maker_app_state_key)  # noqa: SLF001
+        for registry, key in (
+            (self._SESSION_SCOPE_KEY_REGISTRY, self.session_scope_key),
+            (self._ENGINE_APP_STATE_KEY_REGISTRY, self.engine_app_state_key),
+            (self._SESSIONMAKER_APP_STATE_KEY_REGISTRY, self.session_maker_app_state_key),
+        ):
+            registry.add(key)
+            # release the key once the config is garbage collected
+            finalize(self, registry.discard, key)
         if self.before_send_handler is None:
             self.before_send_handler = default_handler_maker(session_scope_key=self.session_scope_key)
         if self.before_send_handler == "autocommit":
@@ -9,7 +9,6 @@ from sqlalchemy.orm.decl_base import _TableArgsType as TableArgsType  # pyright:
 from advanced_alchemy.base import BigIntAuditBase, BigIntBase, merge_table_arguments
 from advanced_alchemy.mixins import SlugKey
 from advanced_alchemy.types import EncryptedString, EncryptedText, FileObject, FileObjectList, StoredObject
-from advanced_alchemy.types.file_object import storages
 
 
 class BigIntAuthor(BigIntAuditBase):
@@ -55,7 +54,7 @@ class BigIntSlugBook(BigIntBase, SlugKey):
 class BigIntEventLog(BigIntAuditBase):
     """The event log domain object."""
 
-    logged_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now())  # pyright: ignore
+    logged_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now)  # pyright: ignore
     payload: Mapped[dict] = mapped_column(default=lambda: {})  # pyright: ignore
 
 
@@ -126,7 +125,3 @@ class BigIntFileDocument(BigIntBase):
         StoredObject(backend="memory", multiple=True),
         nullable=True,
     )
-
-
-if not storages.is_registered("memory"):
-    storages.register_backend("memory://", "memory")
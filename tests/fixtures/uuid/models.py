@@ -18,7 +18,6 @@ from advanced_alchemy.base import (
 )
 from advanced_alchemy.mixins import SlugKey
 from advanced_alchemy.types import EncryptedString, EncryptedText, FileObject, FileObjectList, StoredObject
-from advanced_alchemy.types.file_object import storages
 
 
 class UUIDAuthor(UUIDAuditBase):
@@ -60,7 +59,7 @@ class UUIDSlugBook(UUIDBase, SlugKey):
 class UUIDEventLog(UUIDAuditBase):
     """The event log domain object."""
 
-    logged_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now())  # pyright: ignore
+    logged_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now)  # pyright: ignore
     payload: Mapped[dict] = mapped_column(default={})  # pyright: ignore
 
 
@@ -131,7 +130,3 @@ class UUIDFileDocument(UUIDv7Base):
         StoredObject(backend="memory", multiple=True),
         nullable=True,
     )
-
-
-if not storages.is_registered("memory"):
-    storages.register_backend("memory://", "memory")
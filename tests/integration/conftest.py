@@ -85,6 +85,15 @@ def _patch_bases(monkeypatch: MonkeyPatch) -> None:  # pyright: ignore[reportUnu
     monkeypatch.setattr(base, "BigIntAuditBase", NewBigIntAuditBase)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _register_memory_storage() -> None:  # pyright: ignore[reportUnusedFunction]
+    """Register the ``memory`` storage backend used by the file document fixture models once per session."""
+    from advanced_alchemy.types.file_object import storages
+
+    if not storages.is_registered("memory"):
+        storages.register_backend("memory://", "memory")
+
+
 @pytest.fixture()
 def duckdb_engine(tmp_path: Path) -> Generator[Engine, None, None]:
     engine = create_engine(f"duckdb:///{tmp_path}/test.duck.db", poolclass=NullPool)
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Generator
 from pathlib import Path
 from typing import cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from pytest import CaptureFixture, FixtureRequest
 from pytest_lazy_fixtures import lf
-from sqlalchemy import Engine, ForeignKey, String
+from sqlalchemy import Column, Engine, ForeignKey, MetaData, String, Table, inspect
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from sqlalchemy.orm import Mapped, mapped_column, relationship, sessionmaker
 
@@ -256,19 +257,33 @@ async def test_drop_all(
             assert any_config.metadata
             await conn.run_sync(any_config.metadata.create_all)
 
-    await drop_all(
-        alembic_commands.config.engine,
-        alembic_commands.config.version_table_name,
-        base.metadata_registry.get(alembic_commands.config.bind_key),
-    )
+    version_table_name = alembic_commands.config.version_table_name
+    version_table = Table(version_table_name, MetaData(), Column("version_num", String(32), primary_key=True))
+    if isinstance(any_config, SQLAlchemySyncConfig):
+        version_table.create(any_config.get_engine())
+    else:
+        async with any_config.get_engine().begin() as conn:
+            await conn.run_sync(version_table.create)
+
+    metadata = base.metadata_registry.get(alembic_commands.config.bind_key)
+    await drop_all(alembic_commands.config.engine, version_table_name, metadata)
     result = capfd.readouterr()
     assert "Successfully dropped all objects" in result.out
+    assert version_table_name not in metadata.tables
+    if isinstance(any_config, SQLAlchemySyncConfig):
+        table_names = inspect(any_config.get_engine()).get_table_names()
+    else:
+        async with any_config.get_engine().connect() as conn:
+            table_names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    assert version_table_name not in table_names
 
 
+@pytest.mark.parametrize("concurrent", [False, True], ids=["sequential", "concurrent"])
 async def test_dump_tables(
     any_config: SQLAlchemySyncConfig | SQLAlchemyAsyncConfig,
     capfd: CaptureFixture[str],
     tmp_project_dir: Path,
+    concurrent: bool,
 ) -> None:
     from sqlalchemy.orm import DeclarativeBase
 
@@ -287,20 +302,71 @@ async def test_dump_tables(
     TestBookModel.author = relationship(TestAuthorModel, lazy="joined", innerjoin=True, viewonly=True)
     TestAuthorModel.books = relationship(TestBookModel, back_populates="author", lazy="noload", uselist=True)
 
+    author = TestAuthorModel(id=uuid4(), name="Agatha")
     if isinstance(any_config, SQLAlchemySyncConfig):
         TestBookModel.metadata.create_all(any_config.get_engine())
+        with any_config.get_session() as session:
+            session.add(author)
+            session.add(TestBookModel(title="Poirot", author_id=author.id))
+            session.commit()
     else:
         async with any_config.get_engine().begin() as conn:
             await conn.run_sync(TestBookModel.metadata.create_all)
+        async with any_config.get_session() as session:
+            session.add(author)
+            session.add(TestBookModel(title="Poirot", author_id=author.id))
+            await session.commit()
 
     await dump_tables(
         tmp_project_dir,
         any_config.get_session(),
         [TestAuthorModel, TestBookModel],
+        concurrent=concurrent,
     )
     result = capfd.readouterr()
     assert "Dumping table 'test_author_model'" in result.out
     assert "Dumping table 'test_book_model" in result.out
+    authors = json.loads((tmp_project_dir / "test_author_model.json").read_text())
+    books = json.loads((tmp_project_dir / "test_book_model.json").read_text())
+    assert [row["name"] for row in authors] == ["Agatha"]
+    assert [row["title"] for row in books] == ["Poirot"]
+    assert books[0]["author_id"] == str(author.id)
+
+
+async def test_dump_tables_in_batches(
+    any_config: SQLAlchemySyncConfig | SQLAlchemyAsyncConfig,
+    tmp_project_dir: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    from sqlalchemy.orm import DeclarativeBase
+
+    from advanced_alchemy import base, mixins
+    from advanced_alchemy.alembic import utils
+
+    class _UUIDBase(base.CommonTableAttributes, mixins.UUIDPrimaryKey, DeclarativeBase):
+        registry = base.create_registry()
+
+    class TestBatchModel(_UUIDBase):
+        name: Mapped[str] = mapped_column(String(10))
+
+    monkeypatch.setattr(utils, "_DUMP_BATCH_SIZE", 2)
+    names = [f"row-{i}" for i in range(5)]
+    if isinstance(any_config, SQLAlchemySyncConfig):
+        TestBatchModel.metadata.create_all(any_config.get_engine())
+        with any_config.get_session() as session:
+            session.add_all(TestBatchModel(name=name) for name in names)
+            session.commit()
+    else:
+        async with any_config.get_engine().begin() as conn:
+            await conn.run_sync(TestBatchModel.metadata.create_all)
+        async with any_config.get_session() as session:
+            session.add_all(TestBatchModel(name=name) for name in names)
+            await session.commit()
+
+    await dump_tables(tmp_project_dir, any_config.get_session(), [TestBatchModel])
+    rows = json.loads((tmp_project_dir / "test_batch_model.json").read_text())
+    assert sorted(row["name"] for row in rows) == names
+    assert all(row.keys() == {"id", "name"} for row in rows)
 
 
 """
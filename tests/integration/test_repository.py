@@ -62,7 +62,6 @@ if TYPE_CHECKING:
 pytestmark = [
     pytest.mark.integration,
 ]
-xfail = pytest.mark.xfail
 
 
 RepositoryPKType = Literal["uuid", "bigint"]
@@ -1380,9 +1379,6 @@ async def test_repo_created_updated(
     assert author.updated_at > original_update_dt
 
 
-# This test does not work when run in group for some reason.
-# If you run individually, it'll pass.
-@xfail
 async def test_repo_created_updated_no_listener(
     frozen_datetime: Coordinates,
     author_repo: AuthorRepository,
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import gc
+import io
+import json
+import weakref
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from advanced_alchemy.alembic.utils import (
+    _get_dump_statement,  # pyright: ignore[reportPrivateUsage]
+    _JSONArrayWriter,  # pyright: ignore[reportPrivateUsage]
+)
+
+
+class _ChunkedRawIO(io.RawIOBase):
+    """A raw file accepting at most ``chunk_size`` bytes per write, and none once ``capacity`` is reached."""
+
+    def __init__(self, chunk_size: int, capacity: int | None = None) -> None:
+        self.chunk_size = chunk_size
+        self.capacity = capacity
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int | None:
+        if self.capacity is not None and len(self.data) >= self.capacity:
+            return None
+        chunk = bytes(b)[: self.chunk_size]
+        self.data += chunk
+        return len(chunk)
+
+
+def test_json_array_writer_handles_partial_writes() -> None:
+    fp = _ChunkedRawIO(chunk_size=3)
+    writer = _JSONArrayWriter(fp)
+    writer.extend(b'[{"a":1},{"a":2}]')
+    writer.extend(b'[{"a":3}]')
+    writer.close()
+
+    assert json.loads(fp.data) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+def test_json_array_writer_raises_when_write_would_block() -> None:
+    writer = _JSONArrayWriter(_ChunkedRawIO(chunk_size=3, capacity=3))
+    writer.extend(b'[{"a":1}]')
+
+    with pytest.raises(BlockingIOError):
+        writer.close()
+
+
+def test_get_dump_statement_does_not_keep_model_alive() -> None:
+    class Base(DeclarativeBase):
+        pass
+
+    class Widget(Base):
+        __tablename__ = "widget"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    statement = _get_dump_statement(Widget)
+    assert [column.key for column in statement.selected_columns] == ["id", "name"]
+    assert "yield_per" not in statement.get_execution_options()
+
+    model_ref = weakref.ref(Widget)
+    del Base, Widget, statement
+    gc.collect()
+    assert model_ref() is None
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from sqlalchemy.exc import (
     IntegrityError as SQLAlchemyIntegrityError,
@@ -12,16 +14,36 @@ from sqlalchemy.exc import (
 )
 
 from advanced_alchemy.exceptions import (
+    DUPLICATE_KEY_REGEXES,
     DuplicateKeyError,
+    ForeignKeyError,
     IntegrityError,
     InvalidRequestError,
     MultipleResultsFoundError,
     NotFoundError,
     RepositoryError,
+    _compile_pattern,  # pyright: ignore[reportPrivateUsage]
     wrap_sqlalchemy_exception,
 )
 
 
+@pytest.mark.parametrize(
+    ("args", "detail", "expected"),
+    [
+        ((), "", ""),
+        ((), "detail", "detail"),
+        (("message",), "", "message"),
+        (("message",), "detail", "message detail"),
+        (("first", "second"), "detail", "first second detail"),
+        ((" message ",), " detail ", "message   detail"),
+    ],
+)
+def test_advanced_alchemy_error_str(args: tuple[str, ...], detail: str, expected: str) -> None:
+    error = RepositoryError(*args, detail=detail)
+    assert str(error) == expected
+    assert str(error) == " ".join((*error.args, error.detail)).strip()
+
+
 def test_wrap_sqlalchemy_exception_multiple_results_found() -> None:
     with pytest.raises(MultipleResultsFoundError), wrap_sqlalchemy_exception():
         raise MultipleResultsFound()
@@ -65,6 +87,120 @@ def test_wrap_sqlalchemy_exception_integrity_error_duplicate_key(dialect_name: s
         raise exception
 
 
+@pytest.mark.parametrize(
+    ("dialect_name", "message"),
+    [
+        (
+            "postgresql",
+            'duplicate key value violates unique constraint "uq_table_id"\nDETAIL:  Key (id)=((1)) already exists.',
+        ),
+        ("sqlite", "column id is not unique"),
+        ("sqlite", "columns id, name are not unique"),
+        ("sqlite", "PRIMARY KEY must be unique"),
+        ("mysql", "(1062, \"Duplicate entry 'O'Brien' for key 'table.name'\")"),
+        ("mysql", "1062 (23000): Duplicate entry \\'1\\' for key \\'table.id\\'"),
+    ],
+)
+def test_wrap_sqlalchemy_exception_integrity_error_duplicate_key_variants(dialect_name: str, message: str) -> None:
+    with (
+        pytest.raises(DuplicateKeyError, match="Duplicate key error"),
+        wrap_sqlalchemy_exception(dialect_name=dialect_name, error_messages={"duplicate_key": "Duplicate key error"}),
+    ):
+        raise SQLAlchemyIntegrityError("INSERT INTO table (id) VALUES (1)", {}, Exception(message))
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [("id", "(1)"), ("lower(email::text)", "user@example.com")],
+)
+def test_postgresql_duplicate_key_pattern_parenthesised_key(key: str, value: str) -> None:
+    message = (
+        f'duplicate key value violates unique constraint "uq_table"\nDETAIL:  Key ({key})=({value}) already exists.'
+    )
+    match = DUPLICATE_KEY_REGEXES["postgresql"][0].search(message)
+    assert match is not None
+    assert match.group("key", "value") == (key, value)
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "message"),
+    [
+        (
+            "postgresql",
+            (
+                'insert or update on table "child" violates foreign key constraint "fk_child_parent_id"\n'
+                'DETAIL:  Key (parent_id)=(1) is not present in table "parent".'
+            ),
+        ),
+        ("sqlite", "FOREIGN KEY constraint failed"),
+        (
+            "mysql",
+            (
+                "1452 (23000): Cannot add or update a child row: a foreign key constraint fails "
+                "(`db`.`child`, CONSTRAINT `fk_child_parent_id` FOREIGN KEY (`parent_id`) REFERENCES `parent` (`id`))"
+            ),
+        ),
+        (
+            "mysql",
+            (
+                "1452 (23000): Cannot add or update a child row: a foreign key constraint fails "
+                "(`db`.`order``items`, CONSTRAINT `fk_order``items_order_id` FOREIGN KEY (`order_id`) "
+                "REFERENCES `order` (`id`))"
+            ),
+        ),
+        (
+            "mysql",
+            (
+                "1452 (23000): Cannot add or update a child row: a foreign key constraint fails "
+                '(`db`.`child`, CONSTRAINT `fk_"child"_parent_id` FOREIGN KEY (`parent_id`) REFERENCES `parent` (`id`))'
+            ),
+        ),
+    ],
+)
+def test_wrap_sqlalchemy_exception_integrity_error_foreign_key(dialect_name: str, message: str) -> None:
+    with (
+        pytest.raises(ForeignKeyError, match="Foreign key error"),
+        wrap_sqlalchemy_exception(dialect_name=dialect_name, error_messages={"foreign_key": "Foreign key error"}),
+    ):
+        raise SQLAlchemyIntegrityError("INSERT INTO child (parent_id) VALUES (1)", {}, Exception(message))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        'new row for relation "item" violates check constraint "ck_item_quantity"',
+        'new row for relation "my"tbl" violates check constraint "ck"',
+    ],
+)
+def test_wrap_sqlalchemy_exception_integrity_error_check_constraint(message: str) -> None:
+    with (
+        pytest.raises(IntegrityError, match="Check constraint error") as excinfo,
+        wrap_sqlalchemy_exception(
+            dialect_name="postgresql",
+            error_messages={"check_constraint": "Check constraint error"},
+        ),
+    ):
+        raise SQLAlchemyIntegrityError(
+            "INSERT INTO item (quantity) VALUES (-1)",
+            {},
+            Exception(message),
+        )
+
+    assert type(excinfo.value) is IntegrityError
+
+
+def test_wrap_sqlalchemy_exception_integrity_error_multiple_driver_args() -> None:
+    with (
+        pytest.raises(DuplicateKeyError, match="Duplicate key error"),
+        wrap_sqlalchemy_exception(dialect_name="mysql", error_messages={"duplicate_key": "Duplicate key error"}),
+    ):
+        raise SQLAlchemyIntegrityError(
+            "INSERT INTO table (id) VALUES (1)",
+            {},
+            Exception(1062, "Duplicate entry '1' for key 'table.PRIMARY'"),
+        )
+
+
 def test_wrap_sqlalchemy_exception_integrity_error_other() -> None:
     with pytest.raises(IntegrityError), wrap_sqlalchemy_exception():
         raise SQLAlchemyIntegrityError("original", {}, Exception("original"))
@@ -143,6 +279,16 @@ def test_wrap_sqlalchemy_exception_no_error_messages() -> None:
     assert str(excinfo.value) == "An exception occurred: original"
 
 
+def test_wrap_sqlalchemy_exception_missing_error_message() -> None:
+    with (
+        pytest.raises(RepositoryError) as excinfo,
+        wrap_sqlalchemy_exception(error_messages={"not_found": "Not found"}),
+    ):
+        raise SQLAlchemyError("original")
+
+    assert str(excinfo.value) == "other error: original"
+
+
 def test_wrap_sqlalchemy_exception_no_match() -> None:
     with (
         pytest.raises(IntegrityError) as excinfo,
@@ -154,3 +300,41 @@ def test_wrap_sqlalchemy_exception_no_match() -> None:
         raise SQLAlchemyIntegrityError("original", {}, Exception("original"))
 
     assert str(excinfo.value) == "Integrity error"
+
+
+def test_compile_pattern_falls_back_to_re() -> None:
+    pytest.importorskip("re2")
+
+    assert isinstance(_compile_pattern(r"(?P<quote>['\"]).*(?P=quote)"), re.Pattern)
+    assert not isinstance(_compile_pattern(r"duplicate\s+key"), re.Pattern)
+
+
+def test_wrap_sqlalchemy_exception_integrity_error_dialect_without_patterns() -> None:
+    with (
+        pytest.raises(IntegrityError) as excinfo,
+        wrap_sqlalchemy_exception(
+            dialect_name="oracle",
+            error_messages={"duplicate_key": "Duplicate key error", "integrity": "Integrity error"},
+        ),
+    ):
+        raise SQLAlchemyIntegrityError(
+            "INSERT INTO table (id) VALUES (1)",
+            {},
+            Exception("ORA-00001: unique constraint (SCHEMA.UQ_TABLE_ID) violated"),
+        )
+
+    assert type(excinfo.value) is IntegrityError
+    assert str(excinfo.value) == "Integrity error"
+
+
+def test_wrap_sqlalchemy_exception_as_decorator() -> None:
+    @wrap_sqlalchemy_exception(error_messages={"other": "Custom Error"})
+    def fail() -> None:
+        raise SQLAlchemyError("original")
+
+    with pytest.raises(RepositoryError, match="Custom Error") as excinfo:
+        fail()
+    with pytest.raises(RepositoryError, match="Custom Error"):
+        fail()
+
+    assert isinstance(excinfo.value.__cause__, SQLAlchemyError)
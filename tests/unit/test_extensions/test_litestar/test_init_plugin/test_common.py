@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import gc
 import uuid
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -49,6 +50,20 @@ def test_session_config_dict_with_no_provided_config(
     assert config.session_config_dict == {}
 
 
+def test_app_state_keys_are_unique_across_configs() -> None:
+    """Sync and async configs share their app state keys, and release them once garbage collected."""
+    # release the keys of configs left over from other tests, so that only this test's keys are freed below
+    gc.collect()
+    sync_config = SQLAlchemySyncConfig()
+    async_config = SQLAlchemyAsyncConfig()
+    assert async_config.engine_app_state_key != sync_config.engine_app_state_key
+    assert async_config.session_scope_key != sync_config.session_scope_key
+    engine_app_state_key = sync_config.engine_app_state_key
+    del sync_config, async_config
+    gc.collect()
+    assert SQLAlchemyAsyncConfig().engine_app_state_key == engine_app_state_key
+
+
 def test_config_create_engine_if_engine_instance_provided(
     config_cls: type[SQLAlchemySyncConfig],
 ) -> None:
@@ -90,8 +105,8 @@ def test_call_create_engine_callable_type_error_handling(
 
     assert create_engine_callable_mock.call_count == 2
     first_call, second_call = create_engine_callable_mock.mock_calls
-    assert first_call.kwargs.keys() == {"json_deserializer", "json_serializer"}
-    assert second_call.kwargs.keys() == set()
+    assert first_call.kwargs.keys() == {"json_deserializer", "json_serializer", "pool_pre_ping", "query_cache_size"}
+    assert second_call.kwargs.keys() == {"pool_pre_ping", "query_cache_size"}
 
 
 def test_create_session_maker_if_session_maker_provided(